@@ -2,7 +2,9 @@ import argparse
 import logging
 
 from rfremoterunner.rf_server import RobotFrameworkServer
+from rfremoterunner.utils import LOG_FORMAT
 
+LOG_FILE = 'rfremoterunner.rf_server.log'
 logger = logging.getLogger(__name__)
 
 
@@ -11,6 +13,7 @@ def run_agent_deprecated():
     Pass through for the deprecated command line script. Displays a deprecation warning and calls through to the new
     entrypoint.
     """
+    _configure_logging()
     logger.warning('DeprecationWarning: "rfslave" command line has been deprecated and will be removed very soon inline'
                    ' with the movement to drop such terms. Please use "rfagent" instead')
     run_agent()
@@ -20,11 +23,19 @@ def run_agent():
     """
     Run the Robot Framework Agent
     """
+    _configure_logging()
     args = parse_args()
     rfc = RobotFrameworkServer(args.address, args.port, args.debug)
     rfc.serve()
 
 
+def _configure_logging():
+    """
+    Configure logging for the agent. The log file name is kept from when rf_server configured logging on import
+    """
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO, filename=LOG_FILE)
+
+
 def parse_args():
     """
     Parse the input arguments
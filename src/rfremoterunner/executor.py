@@ -2,18 +2,20 @@ import sys
 import os
 import logging
 
-from rfremoterunner.utils import write_file_to_disk
+from rfremoterunner.utils import write_file_to_disk, LOG_FORMAT
 from rfremoterunner.executor_argparser import ExecutorArgumentParser
 from rfremoterunner.rf_client import RemoteFrameworkClient
 
-logging.basicConfig(format='%(created)-10f %(levelname)-5s %(funcName)-22.20s %(lineno)5s %(message)s', level=logging.INFO, filename=f'{__name__}.log' )
-logger = logging.getLogger(__file__)
+LOG_FILE = 'rfremoterunner.rf_client.log'
+logger = logging.getLogger(__name__)
 
 
 def run_executor():
     """
     Initialise and run the executor
     """
+    _configure_logging()
+
     # Parse the input arguments
     arg_parser = ExecutorArgumentParser(sys.argv[1:])
 
@@ -51,5 +53,12 @@ def run_executor():
     sys.exit(result.get('ret_code', 1))
 
 
+def _configure_logging():
+    """
+    Configure logging for the executor. The log file name is kept from when rf_client configured logging on import
+    """
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO, filename=LOG_FILE)
+
+
 if __name__ == '__main__':
     run_executor()
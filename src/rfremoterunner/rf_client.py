@@ -2,16 +2,15 @@ import os
 import sys
 import logging
 import re
-import six.moves.xmlrpc_client as xmlrpc_client
-import six
+import xmlrpc.client as xmlrpc_client
 from robot.api import TestSuiteBuilder
 from robot.libraries import STDLIBS
 from robot.utils.robotpath import find_file
 
-from rfremoterunner.utils import normalize_xmlrpc_address, calculate_ts_parent_path, read_file_from_disk, read_binary_from_disk
+from rfremoterunner.utils import normalize_xmlrpc_address, calculate_ts_parent_path, clear_parent_path_cache, \
+    read_file_from_disk, read_binary_from_disk
 
-logging.basicConfig(format='%(created)-10f %(levelname)-5s %(funcName)-22.20s %(lineno)5s %(message)s', level=logging.INFO, filename=f'{__name__}.log' )
-logger = logging.getLogger(__file__)
+logger = logging.getLogger(__name__)
 DEFAULT_PORT = 1471
 IMPORT_LINE_REGEX = re.compile('^(Resource|Library)([\\s]+)([^[\\n\\r\\s]+)([\\s]+.*)')
 
@@ -62,7 +61,10 @@ class RemoteFrameworkClient:
 
         # Now iterate the suite's family tree, pull out the suites with test cases and resolve their dependencies.
         # Package them up into a dictionary that can be serialized
-        self._package_suite_hierarchy(suite)
+        try:
+            self._package_suite_hierarchy(suite)
+        finally:
+            clear_parent_path_cache()
 
         # Make the RPC
         logger.info('Connecting to: %s', self._address)
@@ -109,7 +111,7 @@ class RemoteFrameworkClient:
             # Use the actual filename here rather than suite.name so that we preserve the file extension
             suite_filename = os.path.basename(suite.source)
             self._suites[suite_filename] = self._process_test_suite(suite)
-            logger.debug(f'suite_filename: {suite_filename}')
+            logger.debug('suite_filename: %s', suite_filename)
 
         # Recurse down and process child suites
         for sub_suite in suite.suites:
@@ -136,8 +138,8 @@ class RemoteFrameworkClient:
         # Recursively parse and process all dependencies and return the patched test suite file
         updated_file = self._process_robot_file(suite)
 
-        logger.debug(f'path: {path}')
-        logger.debug(f'updated_file: \n{updated_file}')
+        logger.debug('path: %s', path)
+        logger.debug('updated_file: \n%s', updated_file)
         return {
             'path': path,
             'suite_data': updated_file
@@ -157,7 +159,7 @@ class RemoteFrameworkClient:
         :return: Dictionary containing the suite file data and path from the root directory
         :rtype: dict
         """
-        if isinstance(source, six.string_types):
+        if isinstance(source, str):
             file_path = source
             is_test_suite = False
         else:
@@ -172,10 +174,10 @@ class RemoteFrameworkClient:
             # Check if the current line is a Library or Resource import
             matches = IMPORT_LINE_REGEX.search(line)
             if matches and len(matches.groups()) == 4:
-                logger.debug(f'match group1: {matches.group(1)}')
-                logger.debug(f'match group2: {matches.group(2)}')
-                logger.debug(f'match group3: {matches.group(3)}')
-                logger.debug(f'match group4: {matches.group(4)}')
+                logger.debug('match group1: %s', matches.group(1))
+                logger.debug('match group2: %s', matches.group(2))
+                logger.debug('match group3: %s', matches.group(3))
+                logger.debug('match group4: %s', matches.group(4))
                 imp_type = matches.group(1)
                 whitespace_sep = matches.group(2)
                 res_path = matches.group(3)
@@ -194,33 +196,33 @@ class RemoteFrameworkClient:
                         and res_path.strip() not in STDLIBS:
                     # Find the actual file path
                     full_path = find_file(res_path, os.path.dirname(file_path), imp_type)
-                    logger.debug(f'full_path:{full_path}.')
-                    logger.debug(f'filename:{filename}.')
+                    logger.debug('full_path: %s', full_path)
+                    logger.debug('filename: %s', filename)
 
                     if imp_type == 'Library':
                         if os.path.isfile(full_path):
-                            logger.debug(f'{full_path} is a file.')
+                            logger.debug('%s is a file.', full_path)
                             # If its a Library (python file) then read the data and add to the dependencies
                             self._dependencies[filename] = read_file_from_disk(full_path)
-                            logger.debug('Library encoded:\n%s'%read_file_from_disk(full_path))
+                            logger.debug('Library encoded:\n%s', self._dependencies[filename])
                         if os.path.isdir(full_path):
-                            logger.debug(f'{full_path} is a directory.')
+                            logger.debug('%s is a directory.', full_path)
                             # If its a Library (python package under directory) then compress it.
                             self._dependencies[filename+'.zip'] = read_binary_from_disk(full_path)
-                            logger.debug('Library encoded:\n%s'%read_binary_from_disk(full_path))
+                            logger.debug('Library archived: %d bytes', len(self._dependencies[filename + '.zip'].data))
 
                     elif imp_type == 'Resource':
                         # If its a Resource, recurse down and parse it
                         if os.path.isfile(full_path):
-                            logger.debug(f'{full_path} is a file.')
+                            logger.debug('%s is a file.', full_path)
                             # If its a Library (python file) then read the data and add to the dependencies
                             self._dependencies[filename] = read_file_from_disk(full_path)
-                            logger.debug('Library encoded:\n%s'%read_file_from_disk(full_path))
+                            logger.debug('Library encoded:\n%s', self._dependencies[filename])
                         if os.path.isdir(full_path):
-                            logger.debug(f'{full_path} is a directory.')
+                            logger.debug('%s is a directory.', full_path)
                             # If its a Library (python package under directory) then compress it.
                             self._dependencies[filename+'.zip'] = read_binary_from_disk(full_path)
-                            logger.debug('Library encoded:\n%s'%read_binary_from_disk(full_path))
+                            logger.debug('Library archived: %d bytes', len(self._dependencies[filename + '.zip'].data))
 
                     else:
                         # If its a Resource, recurse down and parse it
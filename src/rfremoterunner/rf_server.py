@@ -3,15 +3,14 @@ import os
 import shutil
 import sys
 import logging
-import six.moves.xmlrpc_client as xmlrpc_client
-import six.moves.xmlrpc_server as xmlrpc_server
-from six import StringIO
+import xmlrpc.client as xmlrpc_client
+import xmlrpc.server as xmlrpc_server
+from io import StringIO
 from robot.run import run
 
 from rfremoterunner.utils import write_file_to_disk, read_file_from_disk, write_binary_to_disk, read_binary_from_disk
 
-logging.basicConfig(format='%(created)-10f %(levelname)-5s %(funcName)-22.20s %(lineno)5s %(message)s', level=logging.INFO, filename=f'{__name__}.log' )
-logger = logging.getLogger(__file__)
+logger = logging.getLogger(__name__)
 
 DEFAULT_ADDRESS = '0.0.0.0'
 DEFAULT_PORT = 1471
@@ -150,12 +149,13 @@ class RobotFrameworkServer:
             if zip_ext not in ['zip']:
                 logger.debug('Writing dependency to disk: %s', full_path)
                 write_file_to_disk(full_path, dep_data)
-                logger.debug('Library [independant     file] encoded:\n%s' % dep_data)
+                logger.debug('Library [independant     file] encoded:\n%s', dep_data)
             else:
                 full_path = os.path.join(workspace_dir, lib_name)
                 logger.debug('Writing dependency to disk: %s', full_path)
                 write_binary_to_disk(full_path, dep_data)
-                logger.debug('Library [package in directory] encoded:\n%s' % dep_data)
+                archive_size = len(dep_data.data if isinstance(dep_data, xmlrpc_client.Binary) else dep_data)
+                logger.debug('Library [package in directory] archive size: %d bytes', archive_size)
 
         return workspace_dir
 
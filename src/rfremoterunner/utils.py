@@ -1,18 +1,20 @@
-from io import open
+from io import BytesIO
 import os
-import re
-import six
-from shutil import make_archive, unpack_archive, copytree
-from base64 import encodebytes, decodebytes
+import zipfile
+import xmlrpc.client as xmlrpc_client
+from base64 import b64decode
+from functools import lru_cache
 
+# Log format used by the rfagent and rfremoterun entry points
+LOG_FORMAT = '%(created)-10f %(levelname)-5s %(funcName)-22.20s %(lineno)5s %(message)s'
 
-PORT_INC_REGEX = '.*:[0-9]{1,5}$'
+# Archives are only used to ship libraries to the agent, so favour speed over size. Level 1 is several times faster
+# than the default of 6 for a few percent larger output
+ARCHIVE_COMPRESS_LEVEL = 1
 
-# The XML-RPC library may return a string as a str even though it was a unicode on the sending side.
-# We're using UTF-8 file encodings as standard so need to make sure that we're using unicode strings (only an issue in
-# Python 2)
-if six.PY3:
-    unicode = str  # pylint: disable=invalid-name
+# Full suite paths keyed by id(suite). The suite is stored alongside its path so that the id can't be recycled while
+# the entry is cached
+_SUITE_PATH_CACHE = {}
 
 
 def read_file_from_disk(path, encoding='utf-8', into_lines=False):
@@ -33,25 +35,57 @@ def read_file_from_disk(path, encoding='utf-8', into_lines=False):
         return file_handle.readlines() if into_lines else file_handle.read()
 
 
-def read_binary_from_disk(path, into_lines=False):
+def _read_file_bytes(path):
     """
-    Utility function to read and return a binary from disk
+    Reads a whole file into memory with a single sized read, skipping the buffered reader that open() would create
 
     :param path: Path to the file to read
     :type path: str
-    :param into_lines: Whether or not to return a list of lines
-    :type into_lines: bool
 
     :return: Contents of the file
-    :rtype: str, Base64 encoded.
+    :rtype: bytes
     """
-    filename    = os.path.basename(os.path.normpath(path))
-    father_path = os.path.normpath(path).rstrip(f'{filename}')
-    zipfile = make_archive(f'{filename}', 'zip', root_dir=f'{father_path}', base_dir=f'{filename}')
-    with open(zipfile, 'rb') as file_handle:
-        ret =  file_handle.readlines() if into_lines else encodebytes(file_handle.read()).decode()
-        os.remove(zipfile)
-        return ret
+    file_descriptor = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        remaining = os.fstat(file_descriptor).st_size
+        chunks = []
+        # A single read() can return short on very large files, so keep going until EOF
+        while remaining > 0:
+            chunk = os.read(file_descriptor, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(file_descriptor)
+
+
+def read_binary_from_disk(path):
+    """
+    Utility function to read and return a binary from disk
+
+    :param path: Path to the file to read
+    :type path: str
+
+    :return: Zip archive of the directory
+    :rtype: xmlrpc.client.Binary
+    """
+    path = path.rstrip('/\\') or path
+    # Store everything relative to the parent so the archive unpacks into a directory of the same name. Every path
+    # os.walk() yields starts with `path`, so the parent can simply be sliced off
+    parent_len = max(path.rfind('/'), path.rfind(os.sep)) + 1
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=ARCHIVE_COMPRESS_LEVEL) as zip_handle:
+        for dir_path, _, file_names in os.walk(path):
+            zip_handle.write(dir_path, dir_path[parent_len:])
+            for file_name in file_names:
+                full_path = os.path.join(dir_path, file_name)
+                zip_info = zipfile.ZipInfo.from_file(full_path, full_path[parent_len:])
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+                zip_handle.writestr(zip_info, _read_file_bytes(full_path), compresslevel=ARCHIVE_COMPRESS_LEVEL)
+    return xmlrpc_client.Binary(zip_buffer.getvalue())
+
 
 def write_file_to_disk(path, file_contents, encoding='utf-8'):
     """
@@ -60,12 +94,12 @@ def write_file_to_disk(path, file_contents, encoding='utf-8'):
     :param path: Path to write to
     :type path: str
     :param file_contents: Contents of the file
-    :type file_contents: str | unicode
+    :type file_contents: str
     :param encoding: Encoding of the file
     :type encoding: str
     """
     with open(path, 'w', encoding=encoding) as file_handle:
-        file_handle.write(unicode(file_contents))
+        file_handle.write(file_contents)
 
 
 def write_binary_to_disk(path, file_contents):
@@ -74,13 +108,21 @@ def write_binary_to_disk(path, file_contents):
 
     :param path: Path to write to
     :type path: str
-    :param file_contents: Contents of the file
-    :type file_contents: str | unicode
+    :param file_contents: Zip archive created by read_binary_from_disk()
+    :type file_contents: xmlrpc.client.Binary | bytes
     """
-    with open(path+'.zip', 'wb') as file_handle:
-        file_handle.write(decodebytes(file_contents.encode()))
-    unpack_archive(path+'.zip', format='zip')
+    if isinstance(file_contents, xmlrpc_client.Binary):
+        file_contents = file_contents.data
+    elif isinstance(file_contents, str):
+        # Older clients send the archive as a base64 string
+        file_contents = b64decode(file_contents)
+
+    # The archive contains the directory itself, so unpack it alongside rather than inside the given path
+    with zipfile.ZipFile(BytesIO(file_contents)) as zip_handle:
+        zip_handle.extractall(os.path.dirname(os.path.normpath(path)) or os.curdir)
 
+
+@lru_cache(maxsize=64)
 def normalize_xmlrpc_address(address, default_port):
     """
     Normalises the server address by pre-pending with http:// if missing and appending :default_port if missing
@@ -93,13 +135,27 @@ def normalize_xmlrpc_address(address, default_port):
     :return: Normalised address
     :rtype: str
     """
-    if not re.match(re.compile(PORT_INC_REGEX), address):
+    if not _address_has_port(address):
         address = '{}:{}'.format(address, default_port)
     if not address.lower().startswith('http'):
         address = 'http://{}'.format(address)
     return address
 
 
+def _address_has_port(address):
+    """
+    Checks whether an address ends with a port, i.e. a colon followed by 1-5 digits
+
+    :param address: Address to check
+    :type address: str
+
+    :return: True if the address includes a port
+    :rtype: bool
+    """
+    port = address.rpartition(':')[2]
+    return port != address and 0 < len(port) <= 5 and not port.strip('0123456789')
+
+
 def calculate_ts_parent_path(suite):
     """
     Parses up a test suite's ancestry and builds up a file path. This will then be used to create the correct test
@@ -111,14 +167,39 @@ def calculate_ts_parent_path(suite):
     :return: file path of where the given suite is relative to the root test suite
     :rtype: str
     """
-    family_tree = []
-
     if not suite.parent:
         return ''
-    current_suite = suite.parent
-    while current_suite:
-        family_tree.append(current_suite.name)
-        current_suite = current_suite.parent
+    return _calculate_ts_path(suite.parent)
+
+
+def _calculate_ts_path(suite):
+    """
+    Builds the file path of a test suite, including its own name, reusing the cached paths of its ancestors so that
+    sibling suites don't each walk the full ancestry
+
+    :param suite: test suite to build the path for
+    :type suite: robot.running.model.TestSuite
+
+    :return: file path of the given suite relative to the root test suite
+    :rtype: str
+    """
+    cached = _SUITE_PATH_CACHE.get(id(suite))
+    if cached:
+        return cached[1]
 
     # Stick with unix style slashes for consistency
-    return os.path.join(*reversed(family_tree)).replace('\\', '/')
+    path = _calculate_ts_path(suite.parent) if suite.parent else ''
+    if path and suite.name:
+        path = '{}/{}'.format(path, suite.name)
+    else:
+        path = path or suite.name
+    _SUITE_PATH_CACHE[id(suite)] = (suite, path)
+    return path
+
+
+def clear_parent_path_cache():
+    """
+    Clears the suite paths cached by calculate_ts_parent_path(). This should be called once a suite hierarchy has been
+    processed so that the suites can be garbage collected
+    """
+    _SUITE_PATH_CACHE.clear()
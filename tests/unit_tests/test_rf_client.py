@@ -1,7 +1,7 @@
 from io import open
 import os
 import unittest
-import six.moves.xmlrpc_client as xmlrpc_client
+import xmlrpc.client as xmlrpc_client
 from mock import patch, MagicMock
 from robot.api import TestSuiteBuilder
 
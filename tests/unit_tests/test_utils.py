@@ -3,12 +3,15 @@ import unittest
 import tempfile
 import shutil
 import os
-from io import open
-import six
+import sys
+import zipfile
+from base64 import encodebytes
+from io import open, BytesIO
 from robot.running.model import TestSuite
 
+from rfremoterunner import utils as rf_utils
 from rfremoterunner.utils import normalize_xmlrpc_address, calculate_ts_parent_path, read_file_from_disk, \
-    write_file_to_disk
+    write_file_to_disk, read_binary_from_disk, write_binary_to_disk, clear_parent_path_cache
 
 
 class TestUtils(unittest.TestCase):
@@ -24,6 +27,7 @@ class TestUtils(unittest.TestCase):
 
     def tearDown(self):
         shutil.rmtree(self.workspace)
+        clear_parent_path_cache()
 
     @staticmethod
     def file_contents_is_equal(file_path, expected_file_data):
@@ -61,6 +65,15 @@ class TestUtils(unittest.TestCase):
         actual_val = normalize_xmlrpc_address(input_val, 1471)
         self.assertEqual(expected_val, actual_val)
 
+    def test_normalize_xmlrpc_address_invalid_port(self):
+        """
+        Test that normalize_xmlrpc_address() appends the default port when the existing suffix is not a valid port
+        """
+        input_val = 'http://10.20.30.40:123456'
+        expected_val = 'http://10.20.30.40:123456:1471'
+        actual_val = normalize_xmlrpc_address(input_val, 1471)
+        self.assertEqual(expected_val, actual_val)
+
     def test_read_file_from_disk(self):
         """
         Test that read_file_from_disk() correctly reads file bytes
@@ -75,6 +88,49 @@ class TestUtils(unittest.TestCase):
         actual_data = read_file_from_disk(self.test_file1, into_lines=True)
         self.assertEqual(self.test_file1_data, ''.join(actual_data))
 
+    def test_read_binary_from_disk(self):
+        """
+        Test that read_binary_from_disk() archives a directory relative to its parent
+        """
+        package_dir = os.path.join(self.workspace, 'package')
+        os.makedirs(os.path.join(package_dir, 'sub_package'))
+        write_file_to_disk(os.path.join(package_dir, '__init__.py'), u'')
+        write_file_to_disk(os.path.join(package_dir, 'sub_package', 'module.py'), self.test_file1_data)
+
+        actual_data = read_binary_from_disk(package_dir + os.sep)
+        with zipfile.ZipFile(BytesIO(actual_data.data)) as zip_handle:
+            self.assertIn('package/__init__.py', zip_handle.namelist())
+            self.assertEqual(self.test_file1_data,
+                             zip_handle.read('package/sub_package/module.py').decode('utf-8'))
+
+    def test_write_binary_to_disk(self):
+        """
+        Test that write_binary_to_disk() unpacks an archive created by read_binary_from_disk()
+        """
+        package_dir = os.path.join(self.workspace, 'package')
+        os.makedirs(package_dir)
+        write_file_to_disk(os.path.join(package_dir, 'module.py'), self.test_file1_data)
+        file_data = read_binary_from_disk(package_dir)
+
+        dest_dir = os.path.join(self.workspace, 'dest')
+        os.makedirs(dest_dir)
+        write_binary_to_disk(os.path.join(dest_dir, 'package'), file_data)
+        self.file_contents_is_equal(os.path.join(dest_dir, 'package', 'module.py'), self.test_file1_data)
+
+    def test_write_binary_to_disk_base64_string(self):
+        """
+        Test that write_binary_to_disk() unpacks a base64 string archive, as sent by older clients
+        """
+        package_dir = os.path.join(self.workspace, 'package')
+        os.makedirs(package_dir)
+        write_file_to_disk(os.path.join(package_dir, 'module.py'), self.test_file1_data)
+        file_data = encodebytes(read_binary_from_disk(package_dir).data).decode()
+
+        dest_dir = os.path.join(self.workspace, 'dest')
+        os.makedirs(dest_dir)
+        write_binary_to_disk(os.path.join(dest_dir, 'package'), file_data)
+        self.file_contents_is_equal(os.path.join(dest_dir, 'package', 'module.py'), self.test_file1_data)
+
     def test_write_file_to_disk(self):
         """
         Test that write_file_to_disk() correctly writes unicode data to disk
@@ -83,7 +139,6 @@ class TestUtils(unittest.TestCase):
         write_file_to_disk(self.test_file2, file_data)
         self.file_contents_is_equal(self.test_file2, file_data)
 
-    @unittest.skipIf(six.PY3, "Specific test for single-byte characters which is not relevant in Py3")
     def test_write_file_to_disk_str(self):
         """
         Test that write_file_to_disk() correctly writes single byte string data to disk
@@ -118,3 +173,43 @@ class TestUtils(unittest.TestCase):
         test_suite = TestSuite()
         actual_value = calculate_ts_parent_path(test_suite)
         self.assertEqual(expected_value, actual_value)
+
+    def test_calculate_ts_parent_path_cached(self):
+        """
+        Test that calculate_ts_parent_path() reuses the cached ancestor path until the cache is cleared
+        """
+        grandfather_ts = TestSuite()
+        grandfather_ts.name = 'grandfather'
+        father_ts = TestSuite()
+        father_ts.name = 'father'
+        father_ts.parent = grandfather_ts
+        first_ts = TestSuite()
+        first_ts.parent = father_ts
+        second_ts = TestSuite()
+        second_ts.parent = father_ts
+
+        self.assertEqual('grandfather/father', calculate_ts_parent_path(first_ts))
+        # A rename isn't picked up while the path is cached...
+        father_ts.name = 'renamed'
+        self.assertEqual('grandfather/father', calculate_ts_parent_path(second_ts))
+        # ...but is once the cache has been cleared
+        clear_parent_path_cache()
+        self.assertEqual('grandfather/renamed', calculate_ts_parent_path(second_ts))
+
+    def test_clear_parent_path_cache(self):
+        """
+        Test that clear_parent_path_cache() empties the cache and releases its references to the suites
+        """
+        father_ts = TestSuite()
+        father_ts.name = 'father'
+        main_ts = TestSuite()
+        main_ts.parent = father_ts
+        ref_count = sys.getrefcount(father_ts)
+
+        calculate_ts_parent_path(main_ts)
+        self.assertTrue(rf_utils._SUITE_PATH_CACHE)  # pylint: disable=protected-access
+        self.assertGreater(sys.getrefcount(father_ts), ref_count)
+
+        clear_parent_path_cache()
+        self.assertEqual({}, rf_utils._SUITE_PATH_CACHE)  # pylint: disable=protected-access
+        self.assertEqual(ref_count, sys.getrefcount(father_ts))